@@ -1,7 +1,143 @@
+import re
+from collections import Counter
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from ngram import NGram
 import jellyfish
-from rapidfuzz import fuzz
+from rapidfuzz import process
+from rapidfuzz.distance import Levenshtein
+
+# Worker count for rapidfuzz batch scoring: -1 uses every core. This is the
+# one scoring path that releases the GIL, so it is where parallelism lives;
+# the pure-Python trigram and Soundex loops would serialize on the GIL if
+# pushed onto threads.
+_CDIST_WORKERS = -1
+
+@lru_cache(maxsize=8192)
+def _trigrams(text):
+    # '$'-padded trigram counts, identical to how the ngram library splits
+    # strings for N=3 (pad_len = N - 1 on both sides). Counts, not a set:
+    # NGram.compare scores repeated trigrams with their multiplicity.
+    # The total is cached alongside so pairwise scoring never re-sums it.
+    padded = '$$' + text + '$$'
+    counts = Counter(padded[i:i+3] for i in range(len(padded) - 2))
+    return counts, len(padded) - 2
+
+@lru_cache(maxsize=4096)
+def _ngram3(name1, name2):
+    counts1, total1 = _trigrams(name1)
+    counts2, total2 = _trigrams(name2)
+    if total2 < total1:
+        counts1, counts2 = counts2, counts1
+    shared = sum(min(count, counts2[gram])
+                 for gram, count in counts1.items() if gram in counts2)
+    total = total1 + total2 - shared
+    return shared / total if total else 0.0
+
+@lru_cache(maxsize=8192)
+def _soundex(name):
+    return jellyfish.soundex(name)
+
+def _jaro_winkler_similarity(s1, s2):
+    # Handle empty strings
+    if len(s1) == 0 and len(s2) == 0:
+        return 1.0
+    if len(s1) == 0 or len(s2) == 0:
+        return 0.0
+
+    # Find matching characters and their pairs
+    max_distance = (max(len(s1), len(s2)) // 2) - 1
+    possible_j_for_i = [[] for _ in range(len(s1))]
+    for i in range(len(s1)):
+        for j in range(len(s2)):
+            if s1[i] == s2[j] and abs(i - j) <= max_distance:
+                possible_j_for_i[i].append(j)
+
+    # Find matching pairs (greedy approach)
+    used_j = set()
+    matching_pairs = []
+    for i in range(len(s1)):
+        for j in possible_j_for_i[i]:
+            if j not in used_j:
+                used_j.add(j)
+                matching_pairs.append((i, j))
+                break
+
+    m = len(matching_pairs)
+    if m == 0:
+        return 0.0
+
+    # Calculate transpositions (t)
+    t = sum(1 for i, j in matching_pairs if i != j) / 2.0
+
+    # Calculate Jaro similarity
+    jaro = (m / len(s1) + m / len(s2) + (m - t) / m) / 3.0
+
+    # Calculate common prefix length (up to 4)
+    l = 0
+    for i in range(min(len(s1), len(s2), 4)):
+        if s1[i] == s2[i]:
+            l += 1
+        else:
+            break
+
+    # Calculate Jaro-Winkler similarity with p=0.1
+    p = 0.1
+    jaro_winkler = jaro + l * p * (1 - jaro)
+
+    return jaro_winkler
+
+def _jaccard_similarity(s1, s2):
+    # Handle empty strings
+    if len(s1) == 0 and len(s2) == 0:
+        return 1.0
+    if len(s1) == 0 or len(s2) == 0:
+        return 0.0
+
+    # Convert strings to sets of words
+    set1 = set(s1.split())
+    set2 = set(s2.split())
+
+    # Calculate intersection and union
+    intersection = len(set1 & set2)
+    union = len(set1 | set2)
+
+    # Jaccard similarity is intersection over union
+    return intersection / union if union > 0 else 0.0
+
+@lru_cache(maxsize=128)
+def _acronym_pattern(acronyms):
+    # Longest alternatives first so overlapping acronyms prefer the longer
+    # token; the lookarounds restrict matches to whole whitespace-delimited
+    # words, mirroring the old split()-based membership test.
+    escaped = sorted((re.escape(acronym) for acronym in acronyms),
+                     key=len, reverse=True)
+    return re.compile(r'(?<!\S)(?:' + '|'.join(escaped) + r')(?!\S)')
+
+@lru_cache(maxsize=8192)
+def _expand_acronyms(text, acronym_items):
+    # acronym_items is the acronym dict as a sorted tuple of pairs so the
+    # (value, dict) combination is hashable; the same value then expands
+    # only once across matchers and across calls.
+    if not acronym_items:
+        return (text,)
+    acronym_dict = dict(acronym_items)
+    variations = [text]
+    pattern = _acronym_pattern(frozenset(acronym_dict))
+    for match in pattern.finditer(text):
+        expanded = acronym_dict[match.group()]
+        variations.append(text[:match.start()] + expanded + text[match.end():])
+    return tuple(variations)
+
+def _acronym_items(acronym_dict):
+    return tuple(sorted(acronym_dict.items())) if acronym_dict else ()
+
+def expand_acronyms(text, acronym_dict):
+    """Return `text` plus one variation per acronym word replaced by its expansion."""
+    if not acronym_dict:
+        return [text]
+    return list(_expand_acronyms(text, _acronym_items(acronym_dict)))
 
 def ngram_match(user_input, customer_df, column_to_check, acronym_dict=None):
     """
@@ -13,43 +149,34 @@ def ngram_match(user_input, customer_df, column_to_check, acronym_dict=None):
     if column_to_check not in customer_df.columns:
         raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    temp_df = customer_df.copy()
-    if acronym_dict is None:
-        acronym_dict = {}
-
-    def ngram_similarity(name1, name2, n=3):
-        return NGram.compare(name1, name2, N=n)
-
-    def expand_acronyms(text, acronym_dict):
-        variations = [text]
-        words = text.split()
-        for i, word in enumerate(words):
-            if word in acronym_dict:
-                expanded = acronym_dict[word]
-                new_variation = " ".join(words[:i] + [expanded] + words[i+1:])
-                variations.append(new_variation)
-        return variations
-
-    temp_df['ngram_score'] = 0.0
-    temp_df['best_ngram_form'] = ""
-
-    for index, row in temp_df.iterrows():
-        original_value = row[column_to_check]
-        value_variations = expand_acronyms(original_value, acronym_dict)
-        
+    acronym_items = _acronym_items(acronym_dict)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    best_by_value = {}
+    for original_value in values:
+        if original_value in best_by_value:
+            continue
+
         best_ngram_score = 0.0
         best_form = original_value
-        
-        for variation in value_variations:
-            score = ngram_similarity(user_input, variation, n=3)
+
+        for variation in _expand_acronyms(original_value, acronym_items):
+            score = _ngram3(user_input, variation)
             if score > best_ngram_score:
                 best_ngram_score = score
                 best_form = variation
-        
-        temp_df.at[index, 'ngram_score'] = best_ngram_score
-        temp_df.at[index, 'best_ngram_form'] = best_form
+                if best_ngram_score >= 1.0:
+                    break  # No later variation can beat a perfect score.
+
+        best_by_value[original_value] = (best_ngram_score, best_form)
 
-    return temp_df[[column_to_check, 'ngram_score', 'best_ngram_form']]
+    return pd.DataFrame({
+        column_to_check: values,
+        'ngram_score': [best_by_value[value][0] for value in values],
+        'best_ngram_form': [best_by_value[value][1] for value in values]
+    })
 
 def phonetic_match(user_input, customer_df, column_to_check, acronym_dict=None):
     """
@@ -61,45 +188,36 @@ def phonetic_match(user_input, customer_df, column_to_check, acronym_dict=None):
     if column_to_check not in customer_df.columns:
         raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    temp_df = customer_df.copy()
-    if acronym_dict is None:
-        acronym_dict = {}
-
-    def phonetic_similarity(name1, name2):
-        soundex1 = jellyfish.soundex(name1)
-        soundex2 = jellyfish.soundex(name2)
-        return 1 if soundex1 == soundex2 else 0
-
-    def expand_acronyms(text, acronym_dict):
-        variations = [text]
-        words = text.split()
-        for i, word in enumerate(words):
-            if word in acronym_dict:
-                expanded = acronym_dict[word]
-                new_variation = " ".join(words[:i] + [expanded] + words[i+1:])
-                variations.append(new_variation)
-        return variations
-
-    temp_df['phonetic_match'] = 0
-    temp_df['best_phonetic_form'] = ""
-
-    for index, row in temp_df.iterrows():
-        original_value = row[column_to_check]
-        value_variations = expand_acronyms(original_value, acronym_dict)
-        
+    acronym_items = _acronym_items(acronym_dict)
+
+    # The query's Soundex code never changes within a call, so derive it
+    # once and compare codes directly in the loop.
+    user_code = _soundex(user_input)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    best_by_value = {}
+    for original_value in values:
+        if original_value in best_by_value:
+            continue
+
         best_phonetic_score = 0
         best_form = original_value
-        
-        for variation in value_variations:
-            score = phonetic_similarity(user_input, variation)
-            if score > best_phonetic_score:
-                best_phonetic_score = score
+
+        for variation in _expand_acronyms(original_value, acronym_items):
+            if _soundex(variation) == user_code:
+                best_phonetic_score = 1
                 best_form = variation
-        
-        temp_df.at[index, 'phonetic_match'] = best_phonetic_score
-        temp_df.at[index, 'best_phonetic_form'] = best_form
+                break  # The flag is binary, so the first hit is final.
+
+        best_by_value[original_value] = (best_phonetic_score, best_form)
 
-    return temp_df[[column_to_check, 'phonetic_match', 'best_phonetic_form']]
+    return pd.DataFrame({
+        column_to_check: values,
+        'phonetic_match': [best_by_value[value][0] for value in values],
+        'best_phonetic_form': [best_by_value[value][1] for value in values]
+    })
 
 def levenshtein_match(user_input, customer_df, column_to_check, acronym_dict=None):
     """
@@ -111,43 +229,57 @@ def levenshtein_match(user_input, customer_df, column_to_check, acronym_dict=Non
     if column_to_check not in customer_df.columns:
         raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    temp_df = customer_df.copy()
-    if acronym_dict is None:
-        acronym_dict = {}
-
-    def levenshtein_similarity(name1, name2):
-        return fuzz.ratio(name1, name2) / 100  # Normalize to 0-1
-
-    def expand_acronyms(text, acronym_dict):
-        variations = [text]
-        words = text.split()
-        for i, word in enumerate(words):
-            if word in acronym_dict:
-                expanded = acronym_dict[word]
-                new_variation = " ".join(words[:i] + [expanded] + words[i+1:])
-                variations.append(new_variation)
-        return variations
-
-    temp_df['levenshtein_score'] = 0.0
-    temp_df['best_levenshtein_form'] = ""
-
-    for index, row in temp_df.iterrows():
-        original_value = row[column_to_check]
-        value_variations = expand_acronyms(original_value, acronym_dict)
-        
-        best_levenshtein_score = 0.0
-        best_form = original_value
-        
-        for variation in value_variations:
-            score = levenshtein_similarity(user_input, variation)
-            if score > best_levenshtein_score:
-                best_levenshtein_score = score
-                best_form = variation
-        
-        temp_df.at[index, 'levenshtein_score'] = best_levenshtein_score
-        temp_df.at[index, 'best_levenshtein_form'] = best_form
+    acronym_items = _acronym_items(acronym_dict)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+    if len(values) == 0:
+        return pd.DataFrame({
+            column_to_check: values,
+            'levenshtein_score': [],
+            'best_levenshtein_form': []
+        })
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    # Flatten all variations so the distinct values are scored in a single
+    # cdist call (C inner loop, GIL released) instead of one fuzz.ratio
+    # call per (row, variation) pair.
+    unique_values = list(dict.fromkeys(values))
+    all_variations = []
+    starts = []
+    for original_value in unique_values:
+        starts.append(len(all_variations))
+        all_variations.extend(_expand_acronyms(original_value, acronym_items))
+
+    # Levenshtein.normalized_similarity runs Myers' bit-parallel algorithm
+    # for strings up to 64 characters, which covers names comfortably, and
+    # already yields scores in the 0-1 range.
+    flat_scores = process.cdist(
+        [user_input], all_variations,
+        scorer=Levenshtein.normalized_similarity, workers=_CDIST_WORKERS
+    )[0]
+
+    starts = np.array(starts)
+    unique_scores = np.maximum.reduceat(flat_scores, starts)
+
+    # First index hitting the per-value max, found without a Python loop.
+    counts = np.diff(np.append(starts, len(all_variations)))
+    candidates = np.where(
+        flat_scores == np.repeat(unique_scores, counts),
+        np.arange(len(all_variations)),
+        len(all_variations)
+    )
+    best_indices = np.minimum.reduceat(candidates, starts)
+
+    best_by_value = {
+        value: (unique_scores[i], all_variations[best_indices[i]])
+        for i, value in enumerate(unique_values)
+    }
 
-    return temp_df[[column_to_check, 'levenshtein_score', 'best_levenshtein_form']]
+    return pd.DataFrame({
+        column_to_check: values,
+        'levenshtein_score': [best_by_value[value][0] for value in values],
+        'best_levenshtein_form': [best_by_value[value][1] for value in values]
+    })
 
 def jaro_winkler_match(user_input, customer_df, column_to_check, acronym_dict=None):
     """
@@ -165,89 +297,35 @@ def jaro_winkler_match(user_input, customer_df, column_to_check, acronym_dict=No
     if column_to_check not in customer_df.columns:
         raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    temp_df = customer_df.copy()
-    if acronym_dict is None:
-        acronym_dict = {}
-
-    def jaro_winkler_similarity(s1, s2):
-        # Handle empty strings
-        if len(s1) == 0 and len(s2) == 0:
-            return 1.0
-        if len(s1) == 0 or len(s2) == 0:
-            return 0.0
-
-        # Find matching characters and their pairs
-        max_distance = (max(len(s1), len(s2)) // 2) - 1
-        possible_j_for_i = [[] for _ in range(len(s1))]
-        for i in range(len(s1)):
-            for j in range(len(s2)):
-                if s1[i] == s2[j] and abs(i - j) <= max_distance:
-                    possible_j_for_i[i].append(j)
-
-        # Find matching pairs (greedy approach)
-        used_j = set()
-        matching_pairs = []
-        for i in range(len(s1)):
-            for j in possible_j_for_i[i]:
-                if j not in used_j:
-                    used_j.add(j)
-                    matching_pairs.append((i, j))
-                    break
-
-        m = len(matching_pairs)
-        if m == 0:
-            return 0.0
-
-        # Calculate transpositions (t)
-        t = sum(1 for i, j in matching_pairs if i != j) / 2.0
-
-        # Calculate Jaro similarity
-        jaro = (m / len(s1) + m / len(s2) + (m - t) / m) / 3.0
-
-        # Calculate common prefix length (up to 4)
-        l = 0
-        for i in range(min(len(s1), len(s2), 4)):
-            if s1[i] == s2[i]:
-                l += 1
-            else:
-                break
+    acronym_items = _acronym_items(acronym_dict)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    best_by_value = {}
+    for value in values:
+        if value in best_by_value:
+            continue
+        original_value = str(value)  # Ensure string type
 
-        # Calculate Jaro-Winkler similarity with p=0.1
-        p = 0.1
-        jaro_winkler = jaro + l * p * (1 - jaro)
-
-        return jaro_winkler
-
-    def expand_acronyms(text, acronym_dict):
-        variations = [text]
-        words = text.split()
-        for i, word in enumerate(words):
-            if word in acronym_dict:
-                expanded = acronym_dict[word]
-                new_variation = " ".join(words[:i] + [expanded] + words[i+1:])
-                variations.append(new_variation)
-        return variations
-
-    temp_df['jaro_winkler_score'] = 0.0
-    temp_df['best_jaro_winkler_form'] = ""
-
-    for index, row in temp_df.iterrows():
-        original_value = str(row[column_to_check])  # Ensure string type
-        value_variations = expand_acronyms(original_value, acronym_dict)
-        
         best_jaro_winkler_score = 0.0
         best_form = original_value
-        
-        for variation in value_variations:
-            score = jaro_winkler_similarity(user_input, variation)
+
+        for variation in _expand_acronyms(original_value, acronym_items):
+            score = _jaro_winkler_similarity(user_input, variation)
             if score > best_jaro_winkler_score:
                 best_jaro_winkler_score = score
                 best_form = variation
-        
-        temp_df.at[index, 'jaro_winkler_score'] = best_jaro_winkler_score
-        temp_df.at[index, 'best_jaro_winkler_form'] = best_form
+                if best_jaro_winkler_score >= 1.0:
+                    break  # No later variation can beat a perfect score.
+
+        best_by_value[value] = (best_jaro_winkler_score, best_form)
 
-    return temp_df[[column_to_check, 'jaro_winkler_score', 'best_jaro_winkler_form']]
+    return pd.DataFrame({
+        column_to_check: values,
+        'jaro_winkler_score': [best_by_value[value][0] for value in values],
+        'best_jaro_winkler_form': [best_by_value[value][1] for value in values]
+    })
 
 def jaccard_match(user_input, customer_df, column_to_check, acronym_dict=None):
     """
@@ -265,58 +343,105 @@ def jaccard_match(user_input, customer_df, column_to_check, acronym_dict=None):
     if column_to_check not in customer_df.columns:
         raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    temp_df = customer_df.copy()
-    if acronym_dict is None:
-        acronym_dict = {}
-
-    def jaccard_similarity(s1, s2):
-        # Handle empty strings
-        if len(s1) == 0 and len(s2) == 0:
-            return 1.0
-        if len(s1) == 0 or len(s2) == 0:
-            return 0.0
-
-        # Convert strings to sets of words
-        set1 = set(s1.split())
-        set2 = set(s2.split())
-        
-        # Calculate intersection and union
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        
-        # Jaccard similarity is intersection over union
-        return intersection / union if union > 0 else 0.0
-
-    def expand_acronyms(text, acronym_dict):
-        variations = [text]
-        words = text.split()
-        for i, word in enumerate(words):
-            if word in acronym_dict:
-                expanded = acronym_dict[word]
-                new_variation = " ".join(words[:i] + [expanded] + words[i+1:])
-                variations.append(new_variation)
-        return variations
-
-    temp_df['jaccard_score'] = 0.0
-    temp_df['best_jaccard_form'] = ""
-
-    for index, row in temp_df.iterrows():
-        original_value = str(row[column_to_check])  # Ensure string type
-        value_variations = expand_acronyms(original_value, acronym_dict)
-        
+    acronym_items = _acronym_items(acronym_dict)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    best_by_value = {}
+    for value in values:
+        if value in best_by_value:
+            continue
+        original_value = str(value)  # Ensure string type
+
         best_jaccard_score = 0.0
         best_form = original_value
-        
-        for variation in value_variations:
-            score = jaccard_similarity(user_input, variation)
+
+        for variation in _expand_acronyms(original_value, acronym_items):
+            score = _jaccard_similarity(user_input, variation)
             if score > best_jaccard_score:
                 best_jaccard_score = score
                 best_form = variation
-        
-        temp_df.at[index, 'jaccard_score'] = best_jaccard_score
-        temp_df.at[index, 'best_jaccard_form'] = best_form
+                if best_jaccard_score >= 1.0:
+                    break  # No later variation can beat a perfect score.
+
+        best_by_value[value] = (best_jaccard_score, best_form)
+
+    return pd.DataFrame({
+        column_to_check: values,
+        'jaccard_score': [best_by_value[value][0] for value in values],
+        'best_jaccard_form': [best_by_value[value][1] for value in values]
+    })
+
+_SCORE_COLUMNS = {
+    'ngram': 'ngram_score',
+    'phonetic': 'phonetic_match',
+    'levenshtein': 'levenshtein_score',
+}
+
+def _score_all(user_input, customer_df, column_to_check, acronym_dict=None,
+               methods=('ngram', 'phonetic')):
+    """
+    Score every requested method in a single pass over the rows.
+
+    Fusing the matchers means each value is expanded once and only one
+    result frame is allocated, instead of one full pass plus one frame
+    per method followed by a merge.
+
+    Returns:
+    - pd.DataFrame: One row per input row with a score column per method.
+    """
+    if column_to_check not in customer_df.columns:
+        raise ValueError(f"Column '{column_to_check}' not found in DataFrame.")
 
-    return temp_df[[column_to_check, 'jaccard_score', 'best_jaccard_form']]
+    acronym_items = _acronym_items(acronym_dict)
+    user_code = _soundex(user_input)
+
+    values = customer_df[column_to_check].to_numpy(dtype=object)
+
+    # Score each distinct value once and broadcast to duplicate rows.
+    scores_by_value = {}
+    for original_value in values:
+        if original_value in scores_by_value:
+            continue
+
+        variations = _expand_acronyms(original_value, acronym_items)
+        scores = {}
+        if 'phonetic' in methods:
+            scores['phonetic_match'] = 1 if any(
+                _soundex(variation) == user_code for variation in variations
+            ) else 0
+        if 'ngram' in methods:
+            # When phonetic is also requested, keep its prefilter: values
+            # without a phonetic hit are dropped downstream, so their
+            # n-gram score is never consulted.
+            best_ngram_score = 0.0
+            if scores.get('phonetic_match', 1) == 1:
+                for variation in variations:
+                    score = _ngram3(user_input, variation)
+                    if score > best_ngram_score:
+                        best_ngram_score = score
+                        if best_ngram_score >= 1.0:
+                            break
+            scores['ngram_score'] = best_ngram_score
+        if 'levenshtein' in methods:
+            best_levenshtein_score = 0.0
+            for variation in variations:
+                score = Levenshtein.normalized_similarity(user_input, variation)
+                if score > best_levenshtein_score:
+                    best_levenshtein_score = score
+                    if best_levenshtein_score >= 1.0:
+                        break
+            scores['levenshtein_score'] = best_levenshtein_score
+
+        scores_by_value[original_value] = scores
+
+    columns = {column_to_check: values}
+    for method in methods:
+        score_column = _SCORE_COLUMNS[method]
+        columns[score_column] = [scores_by_value[value][score_column]
+                                 for value in values]
+    return pd.DataFrame(columns)
 
 def find_top_matches(user_input, customer_df, column_to_check, acronym_dict=None, top_n=5, method='hybrid'):
     """
@@ -338,89 +463,26 @@ def find_top_matches(user_input, customer_df, column_to_check, acronym_dict=None
 
     if method == 'ngram':
         result_df = ngram_match(user_input, customer_df, column_to_check, acronym_dict)
-        return result_df[[column_to_check, 'ngram_score']].sort_values(by='ngram_score', ascending=False).head(top_n)
+        return result_df.nlargest(top_n, 'ngram_score')[[column_to_check, 'ngram_score']]
     
     elif method == 'phonetic':
         result_df = phonetic_match(user_input, customer_df, column_to_check, acronym_dict)
-        return result_df[[column_to_check, 'phonetic_match']].sort_values(by='phonetic_match', ascending=False).head(top_n)
+        return result_df.nlargest(top_n, 'phonetic_match')[[column_to_check, 'phonetic_match']]
     
     elif method == 'levenshtein':
         result_df = levenshtein_match(user_input, customer_df, column_to_check, acronym_dict)
-        return result_df[[column_to_check, 'levenshtein_score']].sort_values(by='levenshtein_score', ascending=False).head(top_n)
+        return result_df.nlargest(top_n, 'levenshtein_score')[[column_to_check, 'levenshtein_score']]
     
     elif method == "jarowinkler":
         result_df = jaro_winkler_match(user_input, customer_df, column_to_check, acronym_dict)
-        return result_df[[column_to_check, 'jaro_winkler_score']].sort_values(by='jaro_winkler_score', ascending=False).head(top_n)
+        return result_df.nlargest(top_n, 'jaro_winkler_score')[[column_to_check, 'jaro_winkler_score']]
     
     elif method == "jaccard":
         result_df = jaccard_match(user_input, customer_df, column_to_check, acronym_dict)
-        return result_df[[column_to_check, 'jaccard_score']].sort_values(by='jaccard_score', ascending=False).head(top_n)
+        return result_df.nlargest(top_n, 'jaccard_score')[[column_to_check, 'jaccard_score']]
     
     else:  # hybrid (default)
-        ngram_df = ngram_match(user_input, customer_df, column_to_check, acronym_dict)
-        phonetic_df = phonetic_match(user_input, customer_df, column_to_check, acronym_dict)
-        
-        result_df = ngram_df[[column_to_check, 'ngram_score']].merge(
-            phonetic_df[[column_to_check, 'phonetic_match']],
-            on=column_to_check,
-            how='inner'
-        )
-        
-        top_matches = (result_df[result_df['phonetic_match'] == 1]
-                    .sort_values(by='ngram_score', ascending=False)
-                    .head(top_n))
-        return top_matches
-
-# Example usage
-if __name__ == "__main__":
-    # Sample data with acronyms in the values
-    data = {
-        'full_name': [
-            'JS Plumbing',          # "JS" = "John Smith"
-            'Jon Smyth Plumbing',
-            'JB Electrical',        # "JB" = "James Brown"
-            'Jim Browne Electrical',
-            'CJ Bakery',            # "CJ" = "Catherine Jones"
-            'Kathryn Jons Bakery',
-            'Jonah Smithers Plumbing'
-        ]
-    }
-    df = pd.DataFrame(data)
-
-    # Acronym dictionary
-    acronym_dict = {
-        'JS': 'John Smith',
-        'JB': 'James Brown',
-        'CJ': 'Catherine Jones'
-    }
-
-    # Test with hybrid method
-    user_input = "John Sm Plumbing"
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='hybrid')
-    print(f"Top {len(top_matches)} hybrid matches for '{user_input}':")
-    print(top_matches)
-
-    # Test with Levenshtein method
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='levenshtein')
-    print(f"\nTop {len(top_matches)} Levenshtein matches for '{user_input}':")
-    print(top_matches)
-
-    # Test with n-gram method
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='ngram')
-    print(f"\nTop {len(top_matches)} n-gram matches for '{user_input}':")
-    print(top_matches)
-    
-    # Test with phonetic method
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='phonetic')
-    print(f"\nTop {len(top_matches)} phonetic matches for '{user_input}':")
-    print(top_matches)
-    
-    # Test with jarowinkler method
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='jarowinkler')
-    print(f"\nTop {len(top_matches)} jarowinkler matches for '{user_input}':")
-    print(top_matches)
-    
-    # Test with jaccard method
-    top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='jaccard')
-    print(f"\nTop {len(top_matches)} jaccard matches for '{user_input}':")
-    print(top_matches)
\ No newline at end of file
+        result_df = _score_all(user_input, customer_df, column_to_check,
+                               acronym_dict, methods=('ngram', 'phonetic'))
+        result_df = result_df[result_df['phonetic_match'] == 1]
+        return result_df.nlargest(top_n, 'ngram_score')
@@ -0,0 +1,67 @@
+import pandas as pd
+
+import sys
+import os
+
+# Get the absolute path of the current script (myscript.py)
+current_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Move two levels up to the 'project' directory
+project_root = os.path.abspath(os.path.join(current_dir, "..", "..", "app"))
+
+# Add the project root to sys.path
+sys.path.append(project_root)
+
+from utils.matching import find_top_matches
+
+# Sample data with acronyms in the values
+data = {
+    'full_name': [
+        'JS Plumbing',          # "JS" = "John Smith"
+        'Jon Smyth Plumbing',
+        'JB Electrical',        # "JB" = "James Brown"
+        'Jim Browne Electrical',
+        'CJ Bakery',            # "CJ" = "Catherine Jones"
+        'Kathryn Jons Bakery',
+        'Jonah Smithers Plumbing'
+    ]
+}
+df = pd.DataFrame(data)
+
+# Acronym dictionary
+acronym_dict = {
+    'JS': 'John Smith',
+    'JB': 'James Brown',
+    'CJ': 'Catherine Jones'
+}
+
+# Test with hybrid method
+user_input = "John Sm Plumbing"
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='hybrid')
+print(f"Top {len(top_matches)} hybrid matches for '{user_input}':")
+print(top_matches)
+
+# Test with Levenshtein method
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='levenshtein')
+print(f"\nTop {len(top_matches)} Levenshtein matches for '{user_input}':")
+print(top_matches)
+
+# Test with n-gram method
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='ngram')
+print(f"\nTop {len(top_matches)} n-gram matches for '{user_input}':")
+print(top_matches)
+
+# Test with phonetic method
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='phonetic')
+print(f"\nTop {len(top_matches)} phonetic matches for '{user_input}':")
+print(top_matches)
+
+# Test with jarowinkler method
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='jarowinkler')
+print(f"\nTop {len(top_matches)} jarowinkler matches for '{user_input}':")
+print(top_matches)
+
+# Test with jaccard method
+top_matches = find_top_matches(user_input, df, 'full_name', acronym_dict=acronym_dict, method='jaccard')
+print(f"\nTop {len(top_matches)} jaccard matches for '{user_input}':")
+print(top_matches)